@@ -16,7 +16,6 @@ creating the integration representation in hass.data.
 #                 entities
 
 from __future__ import annotations
-from datetime import timedelta
 import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -26,12 +25,18 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import SOURCE_IMPORT
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.helpers.device_registry import DeviceRegistry
+from homeassistant.helpers import device_registry as dr
 from homeassistant.config_entries import ConfigEntryNotReady
 
 from .data_bridge import AnycubicDataBridge
-from .adapter_fascade import MonoXAPIAdapter
-from .const import DOMAIN, PLATFORMS, POLL_INTERVAL, ANYCUBIC_WIFI_PORT
+from .adapter_fascade import MonoXAPIAdapter, invalidate_sysinfo
+from .const import (
+    DOMAIN,
+    PLATFORMS,
+    POLL_INTERVAL_TD,
+    ANYCUBIC_WIFI_PORT,
+    OPT_CLOSE_CONNECTION,
+)
 
 # Logger for the class.
 _LOGGER = logging.getLogger(__name__)
@@ -72,25 +77,29 @@ async def async_setup(hass: HomeAssistant, _: ConfigType) -> bool:
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Anycubic Printer from a config entry. This is where individual
         entries are setup. Start by setting up data location and polling time
-        deltas, and then establish the data bridge to the 3D printer. The first
-        data refresh action occurs, then the sensors are setup.
+        deltas, and then establish the data bridge to the 3D printer. The
+        sensors are setup while the first data refresh runs in the background,
+        so a slow or offline printer does not hold up Home Assistant startup.
     :param hass: HomeAssistant api reference to all of the Home Assistant data.
     :param entry: The config entry to setup.
     :returns: True if the setup was successful. This will always be successful
-        barring problems with Home Assistant or the underlying APIs. In the
-        event a communication-type excepiton occurs, Home Assistant will
-        declare this entry unable to be setup, requiring a reconfiguration or
-        restart to bring us back online."""
+        barring problems with Home Assistant or the underlying APIs. The
+        sensors are unavailable until the printer has answered a request."""
     # setup the basic datastructure in hass.
 
     entry_location = hass.data[DOMAIN].setdefault(entry.entry_id, {})
 
     # setup the data bridge.
-    poll_delta = timedelta(seconds=POLL_INTERVAL)
-    entry_location[CONF_SCAN_INTERVAL] = poll_delta
+    entry_location[CONF_SCAN_INTERVAL] = POLL_INTERVAL_TD
     bridge = get_new_data_bridge(hass, entry)
-    await bridge.async_config_entry_first_refresh()
     entry_location["coordinator"] = bridge
+    # The first refresh is kept out of the tasks Home Assistant waits on
+    # during startup, so a slow or offline printer does not hold it up.
+    # ConfigEntry.async_create_background_task is newer than the minimum
+    # version in hacs.json, so the task is held here and cancelled on unload.
+    entry_location["first_refresh"] = hass.loop.create_task(
+        bridge.async_refresh()
+    )
 
     # Setup the sensors.
     for platform in PLATFORMS:
@@ -116,7 +125,13 @@ def get_new_data_bridge(hass, entry) -> AnycubicDataBridge:
     :param entry: The config entry of item being setup.
     :returns: The data bridge for the given config entry.
     """
-    api = MonoXAPIAdapter(entry.data[CONF_HOST], ANYCUBIC_WIFI_PORT)
+    # The connection is kept open between polls unless the user opted to
+    # close it after every request. Older entries do not have the option.
+    api = MonoXAPIAdapter(
+        entry.data[CONF_HOST],
+        ANYCUBIC_WIFI_PORT,
+        keep_alive=not entry.options.get(OPT_CLOSE_CONNECTION, False),
+    )
     bridge = AnycubicDataBridge(hass, api, entry)
     return bridge
 
@@ -127,19 +142,16 @@ async def opt_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
         particular integration is to simply refresh the entity. Refresh occurs
         by removing the existing device from the registry, thereby taking all
         the device entities with the old device and removing them. Then the
-        device is added back to the registry during async_setup_entry. This
-        will trigger a new entity setup.
+        entry is reloaded, which adds the device back to the registry during
+        async_setup_entry. This will trigger a new entity setup.
     :param hass: HomeAssistant api reference to all of the Home Assistant data.
     :param entry: The config entry of item being setup."""
     # find and remove the device from the registry
-    registry: DeviceRegistry = hass.data["device_registry"]
-    device = registry.async_get_device(identifiers=[(DOMAIN, entry.unique_id)])
-    try:
+    registry = dr.async_get(hass)
+    device = registry.async_get_device(identifiers={(DOMAIN, entry.unique_id)})
+    if device is not None:
         registry.async_remove_device(device.id)
-    except AttributeError:
-        pass
-    # setup the device again
-    await async_setup_entry(hass, entry)
+    # reload the entry which unloads and sets up the device again
     await hass.config_entries.async_reload(entry.entry_id)
 
 
@@ -169,5 +181,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok := await hass.config_entries.async_unload_platforms(
         entry, PLATFORMS
     ):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_location = hass.data[DOMAIN].pop(entry.entry_id)
+        # Don't let a first refresh still in progress outlive the entry.
+        entry_location["first_refresh"].cancel()
+        printer = entry_location["coordinator"].get_printer()
+        invalidate_sysinfo(printer.ip_address, printer.port)
+        await printer.async_close()
     return unload_ok
@@ -6,34 +6,61 @@ the response and send it to the Home Assistant integration. This class acts as
 an adapter for the pip package and as a fascade to the Home Assistant
 integration."""
 from __future__ import annotations
+import asyncio
+from collections.abc import Iterable
 import logging
+import select
+from socket import AF_INET, SOCK_STREAM, socket
+import threading
 import time
 from typing import Type, Union
-from uart_wifi.communication import UartWifi
+# The adapter replaces the private _async_send_request of UartWifi and parses
+# with the private _do_handle, so it is tied to the exact uart-wifi version
+# pinned in manifest.json and requirements.txt. Check both when raising it.
+from uart_wifi.communication import END, UartWifi, _do_handle
+from uart_wifi.errors import ConnectionException
 from uart_wifi.response import MonoXResponseType, MonoXStatus, MonoXSysInfo
 from . import const
 from .const import (
+    ATTR_CURRENT_LAYER,
     ATTR_REMAINING_LAYERS,
+    ATTR_TOTAL_LAYERS,
     ATTR_TOTAL_TIME,
     ATTR_LOOKUP_TABLE,
+    CONNECT_TIMEOUT,
     INTERNAL_FILE,
+    KEEP_ALIVE_IDLE_TIMEOUT,
+    STATUS_CACHE_TTL,
+    SYSINFO_CACHE_TTL,
     TYPE_ML,
     UART_WIFI_PORT,
     API_VALUE_SPLIT_CHAR,
     API_TILDE,
     API_STATUS,
     API_SECONDS_ELAPSE,
+    API_SECONDS_REMAINING,
 )
 from .errors import AnycubicException
 
 # Logger for the class.
 _LOGGER = logging.getLogger(__name__)
 
+# Marker for attributes which are not present in a response.
+_MISSING = object()
+
+# System information by (ip, port), stored as (expiry, MonoXSysInfo).
+_SYSINFO_CACHE: dict[tuple[str, int], tuple[float, MonoXSysInfo]] = {}
+
 
 class MonoXAPIAdapter(UartWifi):
     """Class for MonoX API calls, Adapted to Home Assistant format."""
 
-    def __init__(self, ip_address: str, port: int = UART_WIFI_PORT) -> None:
+    def __init__(
+        self,
+        ip_address: str,
+        port: int = UART_WIFI_PORT,
+        keep_alive: bool = False,
+    ) -> None:
         """Construct our new MonoXAPI object.
         Note if the IP address containt :port, we will use that instead of
         the specified port. This facilitates better unit testing.
@@ -41,14 +68,71 @@ class MonoXAPIAdapter(UartWifi):
         Parameters:
         :ip_address: The IP address to target for communications.
         :port: The port for communications.
+        :keep_alive: If true, the telnet connection is held open between
+        requests instead of being closed after each response.
         """
-        _LOGGER.info("Setting up connection")
+        _LOGGER.debug("Setting up connection")
         the_ip, url_port = _split_ip_and_port(ip_address, port)
         if url_port is not None and url_port != 0:
             port = int(url_port)
         super().__init__(the_ip, port)
         self.ip_address = the_ip
         self.port = port
+        # Status requests which are currently waiting on the printer, keyed
+        # by the request arguments.
+        self._inflight_status: dict[tuple[bool, bool], asyncio.Future] = {}
+        # Recent status results by request arguments, as (expiry, result).
+        self._status_cache: dict[tuple[bool, bool], tuple[float, tuple]] = {}
+        # The raw attributes of the last status and the parsed result.
+        self._last_status: tuple[tuple | None, tuple | None] = (None, None)
+        self._keep_alive = keep_alive
+        # The connection to the printer. Requests are run in the executor,
+        # so the lock keeps two threads from talking over each other.
+        self._socket: socket | None = None
+        self._socket_lock = threading.Lock()
+        # When the connection last completed a request, in monotonic time.
+        self._last_used: float = 0.0
+        # Closes a held connection once it has been idle for a while.
+        self._idle_close: asyncio.TimerHandle | None = None
+
+    async def async_get_current_status(
+        self, convert_seconds: bool, no_extras: bool
+    ) -> Union[MonoXStatus, dict] | bool:
+        """Get the MonoX Status.  The printer has limited connections and
+        broadcasts to all of them, so concurrent callers share a single
+        request rather than each opening a socket, and a status received
+        within the last STATUS_CACHE_TTL seconds is returned without asking
+        again.  The blocking telnet request is run in the executor.
+
+        Parameters:
+        :convert_seconds (bool): see get_current_status.
+        :no_extras (bool): see get_current_status.
+
+        Returns
+        :returns (Union[MonoXStatus, dict] | bool): MonoXStatus, and a dict of
+        extras, or a False."""
+        key = (convert_seconds, no_extras)
+        cached = self._status_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        inflight = self._inflight_status.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(
+                self._async_run_request(
+                    self.get_current_status, convert_seconds, no_extras
+                )
+            )
+            self._inflight_status[key] = inflight
+            inflight.add_done_callback(
+                lambda _: self._inflight_status.pop(key, None)
+            )
+        result = await asyncio.shield(inflight)
+        if result[0]:
+            self._status_cache[key] = (
+                time.monotonic() + STATUS_CACHE_TTL,
+                result,
+            )
+        return result
 
     def get_current_status(
         self, convert_seconds: bool, no_extras: bool
@@ -69,21 +153,73 @@ class MonoXAPIAdapter(UartWifi):
         Returns
         :returns (Union[MonoXStatus, dict] | bool): MonoXStatus, and a dict of
         extras, or a False."""
-        _LOGGER.debug("Collecting Status")
         respone_stream = self.send_request("getstatus,\r\n")
         status: MonoXStatus = _find_response_of_type(
             response=respone_stream, expected_type=MonoXStatus
         )
         if status:
-            extras = {}
-            if not no_extras:
-                extras = _parse_extras(status, convert_seconds)
-            return (status, extras)
+            if no_extras:
+                return (status, {})
+            # The printer often reports the same status between polls, so
+            # the previous result, including the same status object, is
+            # reused when nothing has changed. Parsing leaves the attributes
+            # untouched, so they can be compared without taking a copy.
+            cache_key = (convert_seconds, vars(status))
+            last_key, last_result = self._last_status
+            if cache_key == last_key:
+                return last_result
+            result = (status, _parse_extras(status, convert_seconds))
+            self._last_status = (cache_key, result)
+            return result
         return (False, False)
 
-    def sysinfo(self) -> MonoXSysInfo | bool:
+    async def async_sysinfo(self) -> MonoXSysInfo | bool:
         """Get the MonoX System Information.  Waits for a maximum of 5 seconds.
         In the event we do not return a valid response, we will return None.
+        The blocking telnet request is run in the executor.
+         :returns ( MonoXSysInfo | bool): MonoXSysInfo or a false."""
+        cache_key = (self.ip_address, self.port)
+        cached = _SYSINFO_CACHE.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        sysinfo = await self._async_run_request(self.sysinfo)
+        if sysinfo:
+            # The model, firmware and serial do not change while the device
+            # holds this address, so we hold onto them for a while.
+            _SYSINFO_CACHE[cache_key] = (
+                time.monotonic() + SYSINFO_CACHE_TTL,
+                sysinfo,
+            )
+        return sysinfo
+
+    async def _async_run_request(self, request, *args):
+        """Run a blocking request in the executor. A connection held open
+        afterwards is closed once it has gone KEEP_ALIVE_IDLE_TIMEOUT seconds
+        without another request, so it does not keep one of the printer's
+        limited connections while it is unused.
+        :request: the blocking method to run.
+        :args: the arguments for the method.
+        :returns: the result of the request."""
+        self._cancel_idle_close()
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(None, request, *args)
+        finally:
+            # Another request may have finished while this one was running.
+            self._cancel_idle_close()
+            if self._socket is not None:
+                self._idle_close = loop.call_later(
+                    KEEP_ALIVE_IDLE_TIMEOUT, self.close_if_idle
+                )
+
+    def _cancel_idle_close(self) -> None:
+        """Cancel the scheduled close of an idle connection."""
+        if self._idle_close is not None:
+            self._idle_close.cancel()
+            self._idle_close = None
+
+    def sysinfo(self) -> MonoXSysInfo | bool:
+        """Request the MonoX System Information from the printer.
          :returns ( MonoXSysInfo | bool): MonoXSysInfo or a false."""
         try:
             _LOGGER.debug("Collecting Sysinfo")
@@ -94,6 +230,134 @@ class MonoXAPIAdapter(UartWifi):
         except (OSError, RuntimeError) as ex:
             raise AnycubicException from ex
 
+    def _async_send_request(self, message_to_be_sent: str) -> object:
+        """Send the request over our own connection to the printer. The
+        uart_wifi package opens and closes a socket for every request, which
+        costs a handshake per poll on a device with limited connections. The
+        connection is reused when keep_alive is set, and reopened once if the
+        printer dropped it.
+        :message_to_be_sent: The properly-formatted uart-wifi message.
+        :returns: the responses parsed by uart_wifi."""
+        request = bytes(message_to_be_sent, "utf-8")
+        with self._socket_lock:
+            if time.monotonic() - self._last_used > KEEP_ALIVE_IDLE_TIMEOUT:
+                # Don't trust a connection the printer may have timed out.
+                self._close_socket()
+            reused = self._socket is not None
+            try:
+                try:
+                    received = self._exchange(request)
+                except OSError:
+                    if not reused:
+                        raise
+                    # The printer may have dropped the idle connection.
+                    self._close_socket()
+                    received = self._exchange(request)
+            except OSError as ex:
+                self._close_socket()
+                raise ConnectionException(
+                    "Could not connect to AnyCubic printer at "
+                    + self.ip_address
+                ) from ex
+            if not self._keep_alive or not received.endswith(END):
+                # Don't reuse a connection which left a partial message.
+                self._close_socket()
+            self._last_used = time.monotonic()
+        if self.raw:
+            return received
+        return _do_handle(received)
+
+    def _exchange(self, request: bytes) -> str:
+        """Write the request and read until the end of a message. The
+        response is read in chunks as it arrives, rather than a byte at a
+        time, so a status costs a few reads instead of one per byte.
+        :request: the encoded request.
+        :returns: the raw text received from the printer."""
+        sock = self._ensure_connected()
+        _discard_pending(sock)
+        sock.sendall(request)
+        received = bytearray()
+        end = END.encode()
+        end_time = time.monotonic() + self.max_request_time
+        while not received.endswith(end):
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                break
+            sock.settimeout(remaining)
+            try:
+                chunk = sock.recv(1024)
+            except TimeoutError:
+                break
+            if not chunk:
+                raise ConnectionResetError("Connection closed by printer")
+            received += chunk
+        return received.decode(errors="replace")
+
+    def _ensure_connected(self) -> socket:
+        """Return the open connection, connecting if needed."""
+        if self._socket is None:
+            _LOGGER.debug("connecting to %s", self.server_address)
+            sock = socket(AF_INET, SOCK_STREAM)
+            sock.settimeout(CONNECT_TIMEOUT)
+            try:
+                sock.connect(self.server_address)
+            except OSError:
+                sock.close()
+                raise
+            self._socket = sock
+        return self._socket
+
+    def _close_socket(self) -> None:
+        """Close the connection if it is open."""
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def close_if_idle(self) -> None:
+        """Close the held connection unless a request is using it. This does
+        not block, so it is safe to call from the event loop. A request in
+        progress schedules the close again when it completes."""
+        self._cancel_idle_close()
+        if self._socket_lock.acquire(blocking=False):
+            try:
+                self._close_socket()
+            finally:
+                self._socket_lock.release()
+
+    def close(self) -> None:
+        """Close the connection to the printer. This blocks until any
+        request in progress completes, so call it from the executor. A
+        request which was already on its way to the executor closes its
+        connection afterwards rather than holding a new one open."""
+        with self._socket_lock:
+            self._keep_alive = False
+            self._close_socket()
+
+    async def async_close(self) -> None:
+        """Close the connection to the printer from the event loop. The
+        scheduled close of an idle connection is cancelled first, so no timer
+        holds on to the adapter once it is closed."""
+        self._cancel_idle_close()
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+
+def _discard_pending(sock: socket) -> None:
+    """The printer broadcasts to every listener, so a held connection may
+    have collected messages meant for other clients. Throw them away so they
+    are not mistaken for the response to our next request.
+    :sock: the connection to the printer."""
+    while select.select([sock], [], [], 0)[0]:
+        if not sock.recv(1024):
+            raise ConnectionResetError("Connection closed by printer")
+
+
+def invalidate_sysinfo(ip_address: str, port: int) -> None:
+    """Forget the cached system information for a device. This is used when
+    a config entry is unloaded so the next setup asks the device again.
+    :ip_address: The IP address used by the adapter.
+    :port: The port used by the adapter."""
+    _SYSINFO_CACHE.pop((ip_address, port), None)
+
 
 def _find_response_of_type(
     response: object, expected_type: Type(MonoXResponseType)
@@ -115,12 +379,12 @@ def _find_response_of_type(
     Returns:
     :returns: the first object matching the expected type, or False if no
     match is found."""
-    if isinstance(response, expected_type):
-        return response
-    for item in response:
-        if isinstance(item, expected_type):
-            return item
-    return False
+    if not isinstance(response, Iterable):
+        # A single response is checked the same way as a stream.
+        response = (response,)
+    return next(
+        (item for item in response if isinstance(item, expected_type)), False
+    )
 
 
 def _parse_extras(raw_extras: dict, convert_seconds: bool) -> dict | None:
@@ -134,78 +398,52 @@ def _parse_extras(raw_extras: dict, convert_seconds: bool) -> dict | None:
     Returns:
     :int: the status dictionary
     """
-    extras: dict = {}
-    if not hasattr(raw_extras, API_STATUS):
+    # Take a single snapshot of the response attributes so each row costs a
+    # dict probe rather than a hasattr/getattr pair.
+    raw_values: dict | None = getattr(raw_extras, "__dict__", None)
+    if raw_values is None or API_STATUS not in raw_values:
         # we received a response that does not have the status
-        return extras
-    if convert_seconds and hasattr(raw_extras, API_SECONDS_ELAPSE):
-        # We need to convert the time from minutes to seconds.
-        seconds_elapsed = int(raw_extras.seconds_elapse) / 60
-        raw_extras.__dict__[API_SECONDS_ELAPSE] = seconds_elapsed
+        return {}
+    if convert_seconds and API_SECONDS_ELAPSE in raw_values:
+        # We need to convert the time from minutes to seconds. The converted
+        # value goes into a copy so the response object is left untouched.
+        raw_values = {
+            **raw_values,
+            API_SECONDS_ELAPSE: int(raw_values[API_SECONDS_ELAPSE]) / 60,
+        }
 
+    # Start from every key we may produce so the dict is sized only once.
+    extras: dict = dict.fromkeys(_EXTRAS_KEYS)
     # Loop through all the expected sensors and add them to the extras dict
-    for [
-        api_sensor_name,
-        hass_sensor_name,
-        data_type,
-        _,
-    ] in ATTR_LOOKUP_TABLE:
-        # if the sensor data is present, parse the data
-        if hasattr(raw_extras, api_sensor_name):
-            raw_value = getattr(raw_extras, api_sensor_name)
-            # parse the data based on the expected data type.
-            try:
-                match data_type:
-                    case const.TYPE_FILE:
-                        [external, internal] = raw_value.split(
-                            API_VALUE_SPLIT_CHAR
-                        )
-                        extras[hass_sensor_name] = external
-                        extras[INTERNAL_FILE] = internal
-                    case const.TYPE_FLOAT:
-                        extras[hass_sensor_name] = float(raw_value)
-                    case const.TYPE_ML:
-                        # get the raw numeric value of the sensor without the
-                        # extra stuff
-                        int_value: int = raw_value.replace(
-                            TYPE_ML, ""
-                        ).replace(API_TILDE, "")
-                        extras[hass_sensor_name] = int_value
-                    case const.TYPE_INT:
-                        extras[hass_sensor_name] = int(raw_value)
-                    case const.TYPE_TIME:
-                        extras[hass_sensor_name] = _seconds_to_hhmmss(
-                            raw_value
-                        )
-                    case const.TYPE_STRING:
-                        extras[hass_sensor_name] = raw_value
-                    case _:
-                        extras[hass_sensor_name] = raw_value
-            except ValueError:
-                # if the data is not in expected format, add it as a raw value
-                extras[hass_sensor_name] = raw_value
-
-        else:  # if the sensor data is not present, set a None value
-            extras[hass_sensor_name] = None
-
-    # Add the calculated Remaining Layers sensor
-    if hasattr(raw_extras, "current_layer") and hasattr(
-        raw_extras, "total_layers"
-    ):
-        total = int(raw_extras.total_layers)
-        current = int(raw_extras.current_layer)
-        extras[ATTR_REMAINING_LAYERS] = int(total - current)
+    get_raw_value = raw_values.get
+    for api_sensor_name, hass_sensor_name, parser in _EXTRAS_PARSERS:
+        raw_value = get_raw_value(api_sensor_name, _MISSING)
+        if raw_value is _MISSING:
+            # if the sensor data is not present, leave the None value
+            continue
+        # parse the data based on the expected data type.
+        try:
+            parser(extras, hass_sensor_name, raw_value)
+        except ValueError:
+            # if the data is not in expected format, add it as a raw value
+            extras[hass_sensor_name] = raw_value
+
+    # Add the calculated Remaining Layers sensor from the layers parsed above
+    total = extras[ATTR_TOTAL_LAYERS]
+    current = extras[ATTR_CURRENT_LAYER]
+    if isinstance(total, int) and isinstance(current, int):
+        extras[ATTR_REMAINING_LAYERS] = total - current
     else:
         # There is not enough info to calculate the remaining layers.
         extras[ATTR_REMAINING_LAYERS] = None
 
-    # Add the calculated Seconds Elapsed sensor
-    if hasattr(raw_extras, "seconds_elapse") and hasattr(
-        raw_extras, "seconds_remaining"
-    ):
-        remain = int(raw_extras.seconds_remaining)
-        elapsed = int(raw_extras.seconds_elapse)
-        extras[ATTR_TOTAL_TIME] = _seconds_to_hhmmss(elapsed + remain)
+    # Add the calculated Seconds Elapsed sensor from the same snapshot
+    elapsed = get_raw_value(API_SECONDS_ELAPSE, _MISSING)
+    remain = get_raw_value(API_SECONDS_REMAINING, _MISSING)
+    if elapsed is not _MISSING and remain is not _MISSING:
+        extras[ATTR_TOTAL_TIME] = _seconds_to_hhmmss(
+            int(elapsed) + int(remain)
+        )
     else:
         # There is not enough info to calculate the total time.
         extras[ATTR_TOTAL_TIME] = None
@@ -213,13 +451,82 @@ def _parse_extras(raw_extras: dict, convert_seconds: bool) -> dict | None:
     return extras
 
 
+def _parse_file(extras: dict, hass_sensor_name: str, raw_value) -> None:
+    """Split the file value into the external and internal file names."""
+    [external, internal] = raw_value.split(API_VALUE_SPLIT_CHAR)
+    extras[hass_sensor_name] = external
+    extras[INTERNAL_FILE] = internal
+
+
+def _parse_float(extras: dict, hass_sensor_name: str, raw_value) -> None:
+    """Store the value as a float."""
+    extras[hass_sensor_name] = float(raw_value)
+
+
+def _parse_ml(extras: dict, hass_sensor_name: str, raw_value) -> None:
+    """Store the raw numeric value of the sensor without the extra stuff."""
+    extras[hass_sensor_name] = raw_value.replace(TYPE_ML, "").replace(
+        API_TILDE, ""
+    )
+
+
+def _parse_int(extras: dict, hass_sensor_name: str, raw_value) -> None:
+    """Store the value as an int."""
+    extras[hass_sensor_name] = int(raw_value)
+
+
+def _parse_time(extras: dict, hass_sensor_name: str, raw_value) -> None:
+    """Store the value as a h:min:s time string."""
+    extras[hass_sensor_name] = _seconds_to_hhmmss(raw_value)
+
+
+def _parse_raw(extras: dict, hass_sensor_name: str, raw_value) -> None:
+    """Store the value as it was received."""
+    extras[hass_sensor_name] = raw_value
+
+
 def _seconds_to_hhmmss(raw_value):
     """Convert the raw seconds to the standard defined by
     Home assistant of form: h:min:s.
     :raw_value: the time to convert, in seconds."""
-    gmt_time = time.gmtime(int(raw_value))
-    hhmmss = time.strftime("%H:%M:%S", gmt_time)
-    return hhmmss
+    # Negative durations are reported as zero.
+    hours, remainder = divmod(max(0, int(raw_value)), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+# Parsers for each of the data types found in the ATTR_LOOKUP_TABLE.
+_PARSE_FUNCS = {
+    const.TYPE_FILE: _parse_file,
+    const.TYPE_FLOAT: _parse_float,
+    const.TYPE_ML: _parse_ml,
+    const.TYPE_INT: _parse_int,
+    const.TYPE_TIME: _parse_time,
+    const.TYPE_STRING: _parse_raw,
+}
+
+# The ATTR_LOOKUP_TABLE is static, so the parser for each row is resolved
+# once at import instead of being matched on every poll.
+# [sensor value name, display name, parser]
+_EXTRAS_PARSERS = tuple(
+    (
+        api_sensor_name,
+        hass_sensor_name,
+        _PARSE_FUNCS.get(data_type, _parse_raw),
+    )
+    for api_sensor_name, hass_sensor_name, data_type, _ in ATTR_LOOKUP_TABLE
+)
+
+# Every key _parse_extras produces, in the order in which it produces them.
+_EXTRAS_KEYS = tuple(
+    key
+    for _, hass_sensor_name, data_type, _ in ATTR_LOOKUP_TABLE
+    for key in (
+        (hass_sensor_name, INTERNAL_FILE)
+        if data_type == const.TYPE_FILE
+        else (hass_sensor_name,)
+    )
+) + (ATTR_REMAINING_LAYERS, ATTR_TOTAL_TIME)
 
 
 def _split_ip_and_port(the_ip: str, port) -> tuple[str, int]:
@@ -233,7 +540,7 @@ def _split_ip_and_port(the_ip: str, port) -> tuple[str, int]:
     :returns: if the ip contains a semicolon, then the_ip's port
     will be returned otherwise we return the_ip and port
     """
-    ipsplit = the_ip.split(":")
-    if len(ipsplit) > 1:
-        return ipsplit[0], int(ipsplit[1])
-    return str(ipsplit[0]), int(port)
+    host, separator, url_port = the_ip.rpartition(":")
+    if separator:
+        return host, int(url_port)
+    return the_ip, int(port)
@@ -4,27 +4,39 @@
     Coordinator component, provides a standard way to handle the data update
     procedure."""
 from functools import cached_property
+from operator import itemgetter
+import sys
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import DeviceInfo, Entity
 from homeassistant.const import CONF_HOST, CONF_MODEL
+from homeassistant.core import callback
 
 from .const import (
+    ATTR_LAST_GOOD,
+    MAX_STALE_EXTRAS,
     OPT_HIDE_EXTRA_SENSORS,
     OPT_HIDE_IP,
     OPT_NO_EXTRA_DATA,
     OPT_USE_PICTURE,
 )
-from .img.anycubic import AnycubicImages
 from . import AnycubicDataBridge
 
+# Reads the options which control the extra state attributes in one call.
+_get_extras_options = itemgetter(
+    OPT_NO_EXTRA_DATA, OPT_HIDE_EXTRA_SENSORS, OPT_HIDE_IP
+)
+
 
 class AnycubicEntityBaseDecorator(
     CoordinatorEntity[AnycubicDataBridge], Entity
 ):
     """Base common to all MonoX entities."""
 
+    # The availability, state and attributes last written to Home Assistant.
+    _last_written: tuple | None = None
+
     def __init__(
         self,
         entry: ConfigEntry,
@@ -42,20 +54,28 @@ class AnycubicEntityBaseDecorator(
         # https://developers.home-assistant.io/blog/2022/07/10/entity_naming/
         model = entry.data[CONF_MODEL].replace("Photon ", "")
         self.sensor_attr_name = sensor_generic_name
-        self._attr_name = model + " " + sensor_generic_name
-        self._attr_unique_id = self.entry.entry_id + sensor_generic_name
+        # Home Assistant hashes these on every state update, so intern them.
+        self._attr_name = sys.intern(f"{model} {sensor_generic_name}")
+        self._attr_unique_id = sys.intern(entry.entry_id + sensor_generic_name)
         self.bridge = bridge
+        # The device info is provided in the bridge. It is set in the Base
+        # entity so that it does not need to be inherited by all other
+        # entities. The common device info links all the sensors to the same
+        # device, thus providing a consistent device name and manufacturer.
+        self._attr_device_info: DeviceInfo = bridge.device_info
+        self._attr_entity_picture = self._get_entity_picture()
+        # Options changes reload the entry, so the options are read once.
+        no_extra_data, hide_extra_sensors, hide_ip = _get_extras_options(
+            entry.options
+        )
+        # If user option no extras or hide extras is set, then we dont report.
+        self._suppress_extras: bool = no_extra_data or not hide_extra_sensors
+        # if user option Hide IP is set, then we hide the IP as well.
+        self._host_extra: dict = (
+            {} if hide_ip else {CONF_HOST: entry.data[CONF_HOST]}
+        )
         super().__init__(bridge)
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Retrieves the Device info, provided in the bridge. This is
-        provided in the Base entity so that it does not need to be inherited
-        by ell other entities. The common device info links all the sensors
-        to the same device, thus providing a consistent device name and
-        manufacturer.
-        :return: the device info."""
-        return self.bridge.device_info
+        self._attr_extra_state_attributes = self._build_extra_attributes()
 
     @property
     def available(self) -> bool:
@@ -71,7 +91,28 @@ class AnycubicEntityBaseDecorator(
         If the data bridge is connected, but the sensor is not reporting data,
         the sensor will not be available.
         :return: True if the sensor is available, False otherwise."""
-        return hasattr(self.bridge.data, "status")
+        # The bridge only ever stores a MonoXStatus, which always carries a
+        # status, so data is None exactly when no status has been received.
+        return self.bridge.data is not None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the data bridge. Most of the values
+        reported by the printer do not change between polls, so the state is
+        only written to Home Assistant when the availability, state, or
+        attributes differ from the last write. The attributes are built
+        here once per update and stored, so that Home Assistant reads them
+        back without rebuilding them during the write."""
+        if self.available:
+            attributes = self._build_extra_attributes()
+            self._attr_extra_state_attributes = attributes
+            written = (True, self.state, attributes)
+        else:
+            written = (False,)
+        if written == self._last_written:
+            return
+        self._last_written = written
+        self.async_write_ha_state()
 
     @cached_property
     def assumed_state(self) -> bool:
@@ -83,8 +124,7 @@ class AnycubicEntityBaseDecorator(
         :return: True if the sensor is assumed state, False otherwise."""
         return self.bridge.assumed_state
 
-    @cached_property
-    def entity_picture(self) -> str | None:
+    def _get_entity_picture(self) -> str | None:
         """Return the entity picture. If this is a MonoX, we return a picture
         of the Mono X style printer.  While slight variances exist in the X,
         4K, and 6K printers, the Entity Picture is 100x100 pixels, and
@@ -93,31 +133,38 @@ class AnycubicEntityBaseDecorator(
         displayed, thus resulting in a mdi:printer icon.
         :return: the entity picture if the user has opted to use it."""
         # If the user selected the option..
-        if self.entry.options[OPT_USE_PICTURE]:
+        if self.entry.options.get(OPT_USE_PICTURE):
             # If we have a relevant picture, return it.
             if "model" in self.entry.data and str(
                 self.entry.data["model"]
             ).startswith("Photon Mono X"):
+                # The images are only loaded if a user opts to display them.
+                # pylint: disable-next=import-outside-toplevel
+                from .img.anycubic import AnycubicImages
+
                 return AnycubicImages.MONO_X_IMAGE
         return None
 
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return the state attributes. These are hidden if the user has not
+    def _build_extra_attributes(self) -> dict:
+        """Build the state attributes. These are hidden if the user has not
         selected  to display a single sensor, or if the extras are disabled.
         The Host name will be placed into the extras unless the user has
         disabled the option. The user is in control of these settings via
-        options.
+        options. While the device is failing to respond, the last known
+        extras are reported for a while along with the time they were
+        received. That time does not change between failed polls, so the
+        failed polls after the first do not write another state.
         :return: the state attributes unless otherwise blocked."""
+        if self._suppress_extras:
+            return {**self._host_extra}
         extras = self.bridge.get_last_status_extras()
-        # If user option no extras or hide extras is set, then we dont report.
-        if (
-            self.entry.options[OPT_NO_EXTRA_DATA]
-            or not self.entry.options[OPT_HIDE_EXTRA_SENSORS]
-        ):
-            extras = {}
-
-        # if user option Hide IP is set, then we hide the IP as well.
-        if not self.entry.options[OPT_HIDE_IP]:
-            extras.update({CONF_HOST: self.entry.data[CONF_HOST]})
-        return extras
+        if self.bridge.assumed_state:
+            return {**extras, **self._host_extra}
+        stale_seconds = self.bridge.get_stale_seconds()
+        if stale_seconds is None or stale_seconds > MAX_STALE_EXTRAS:
+            return {**self._host_extra}
+        return {
+            **extras,
+            ATTR_LAST_GOOD: self.bridge.get_last_good_time(),
+            **self._host_extra,
+        }
@@ -15,14 +15,14 @@ from .const import (
     API_MODEL,
     API_SERIAL,
     CONF_DHCP,
-    OPT_HIDE_EXTRA_SENSORS,
-    OPT_USE_PICTURE,
+    CONF_SERIAL,
+    DEFAULT_OPTIONS,
+    DOMAIN,
     SW_VERSION,
 )
 from .errors import AnycubicException
 from .adapter_fascade import MonoXAPIAdapter
 from .options import AnycubicOptionsFlowHandler
-from .const import CONF_SERIAL, DOMAIN, OPT_HIDE_IP, OPT_NO_EXTRA_DATA
 
 # Schema used for initalization of the config flow
 DETECTION_SCHEMA = vol.Schema(
@@ -33,6 +33,16 @@ DETECTION_SCHEMA = vol.Schema(
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maps the sysinfo attributes to the config entry keys they are stored in.
+# The model is used as both the model and the default name of the device.
+_SYSINFO_MAP = (
+    (API_FIRMWARE, SW_VERSION),
+    (API_MODEL, CONF_MODEL),
+    (API_MODEL, CONF_NAME),
+    (API_SERIAL, CONF_SERIAL),
+)
+_MISSING = object()
+
 
 @config_entries.HANDLERS.register(DOMAIN)
 class MyConfigFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -53,6 +63,9 @@ class MyConfigFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         self.import_schema = {}
         self.serial = None
         self.data: dict = {}
+        # The mapped system information from the duplicate check, kept so
+        # the finish step does not query the printer a second time.
+        self.sysinfo_data: dict | None = None
 
     async def async_step_dhcp(
         self, discovery_info: dhcp.DhcpServiceInfo
@@ -72,9 +85,9 @@ class MyConfigFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                     discovered_information
                 )
                 # Before adding the device, we pass it into the user
-                # confirmation step.
+                # confirmation step, which shows the discovered information.
                 if configured:
-                    return await self.async_step_user()
+                    return await self.async_step_user(discovered_information)
                 return False
             except ValueError:
                 # Don't spam the logs because this device just came back online
@@ -85,23 +98,23 @@ class MyConfigFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         """This is where the user or DHCP will provide a host. From there we
         query the device to see if it is duplicated. When launched manually,
         no user input is present, so we show the form. If launched from DHCP,
-        we show the user the device information and ask if it is correct."""
-        if user_input is not None and not hasattr(user_input, CONF_DHCP):
+        we show the user the device information and ask if it is correct. If
+        the device cannot be reached, the form is shown again with an error.
+        """
+        errors = None
+        if user_input is not None and not user_input.get(CONF_DHCP):
             try:
                 configured: bool = await self.async_step_duplicates(user_input)
                 if not configured:
                     return self.async_abort(reason="duplicate_detection")
                 return await self.async_step_finish(user_input)
-            except ValueError:
-                user_input["errors"] = ["connection_error"]
-                return await self.async_step_user()
+            except (ValueError, AnycubicException, ConnectionException):
+                errors = {"base": "connection_error"}
         return self.async_show_form(
             step_id="user",
             description_placeholders=user_input,
             data_schema=DETECTION_SCHEMA,
-            errors=user_input["errors"]
-            if hasattr(user_input, "errors")
-            else None,
+            errors=errors,
         )
 
     async def async_step_duplicates(self, device: dict) -> bool:
@@ -110,7 +123,7 @@ class MyConfigFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         :param device: The device dictionary from the discovery event.
         :return: True if the device is configured, False if not."""
         # Abort if serial is configured
-        self._add_device_info_to_device(device)
+        await self._add_device_info_to_device(device)
         if CONF_SERIAL not in device:
             self.async_abort(reason="not_enough_data")
         await self.async_set_unique_id(device[CONF_SERIAL])
@@ -133,10 +146,11 @@ class MyConfigFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 return False  # Already configured
         return True
 
-    def _add_device_info_to_device(self, device):
+    async def _add_device_info_to_device(self, device):
         adapter = MonoXAPIAdapter(device[CONF_HOST])
-        system_information: MonoXSysInfo() = adapter.sysinfo()
-        device.update(self.map_sysinfo_to_data(system_information))
+        system_information: MonoXSysInfo() = await adapter.async_sysinfo()
+        self.sysinfo_data = _map_sysinfo_to_data(system_information)
+        device.update(self.sysinfo_data)
 
     async def async_step_finish(
         self, discovered_information: dict
@@ -149,12 +163,15 @@ class MyConfigFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         if discovered_information[CONF_HOST] is not None:
             try:
                 self.data[CONF_HOST] = discovered_information[CONF_HOST]
-                adapter = MonoXAPIAdapter(self.data[CONF_HOST])
-                system_information = adapter.sysinfo()
-                if system_information is None:
-                    return
+                sysinfo_data = self.sysinfo_data
+                if sysinfo_data is None:
+                    adapter = MonoXAPIAdapter(self.data[CONF_HOST])
+                    system_information = await adapter.async_sysinfo()
+                    if system_information is None:
+                        return
+                    sysinfo_data = _map_sysinfo_to_data(system_information)
 
-                self.data.update(self.map_sysinfo_to_data(system_information))
+                self.data.update(sysinfo_data)
 
                 await self.async_set_unique_id(self.data[CONF_SERIAL])
 
@@ -169,12 +186,7 @@ class MyConfigFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 return self.async_create_entry(
                     title=self.data[CONF_MODEL],
                     data=self.data,
-                    options={
-                        OPT_HIDE_IP: False,
-                        OPT_NO_EXTRA_DATA: False,
-                        OPT_HIDE_EXTRA_SENSORS: False,
-                        OPT_USE_PICTURE: False,
-                    },
+                    options=dict(DEFAULT_OPTIONS),
                     description="Anycubic Uart Device",
                 )
 
@@ -182,16 +194,12 @@ class MyConfigFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.error("Exception while processing device data %s", ex)
                 return await self.async_step_user()
 
-    def map_sysinfo_to_data(self, sysinfo: MonoXSysInfo) -> dict:
-        """Map the sysInfo result to a dictionary.  This is used to create the
-        config entry."""
-        data: dict = {}
-        if hasattr(sysinfo, API_FIRMWARE):
-            data[SW_VERSION] = sysinfo.firmware
-        if hasattr(sysinfo, API_MODEL):
-            data[CONF_MODEL] = sysinfo.model
-        if hasattr(sysinfo, API_MODEL):
-            data[CONF_NAME] = sysinfo.model
-        if hasattr(sysinfo, API_SERIAL):
-            data[CONF_SERIAL] = sysinfo.serial
-        return data
+
+def _map_sysinfo_to_data(sysinfo: MonoXSysInfo) -> dict:
+    """Map the sysInfo result to a dictionary.  This is used to create the
+    config entry."""
+    return {
+        key: value
+        for attribute, key in _SYSINFO_MAP
+        if (value := getattr(sysinfo, attribute, _MISSING)) is not _MISSING
+    }
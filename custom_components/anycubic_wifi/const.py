@@ -1,5 +1,9 @@
 """Constants for the Anycubic 3D Printer integration."""
 
+from datetime import timedelta
+import sys
+from types import MappingProxyType
+
 from homeassistant.const import (
     Platform,
     PERCENTAGE,
@@ -12,10 +16,15 @@ from uart_wifi.communication import MonoXStatus
 DOMAIN = "anycubic_wifi"
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 ATTR_MANUFACTURER = "Anycubic"
-SUPPORTED_MACS = ["28:6d:cd"]
+# Lowercase OUI prefixes, matched as mac.lower()[:8] in SUPPORTED_MACS.
+SUPPORTED_MACS = frozenset({"28:6d:cd"})
 ANYCUBIC_3D_PRINTER_NAME = "Anycubic 3D Printer"
 NAME = ATTR_MANUFACTURER
 UART_WIFI_PORT = 6000
+CONNECT_TIMEOUT = 2  # seconds
+# Longer than the idle poll interval plus a request, so a held connection is
+# still open for the next poll while the printer is stopped.
+KEEP_ALIVE_IDLE_TIMEOUT = 90  # seconds
 PRINTER_ICON = "mdi:printer-3d"
 DEFAULT_STATE = "offline"
 CONF_SERIAL = "serial_number"
@@ -23,6 +32,13 @@ SW_VERSION = "sw_version"
 SUGGESTED_AREA = "Garage"
 DEFAULT_EVENTS = True
 POLL_INTERVAL = 10  # seconds
+POLL_INTERVAL_TD = timedelta(seconds=POLL_INTERVAL)
+# The printer is polled less often while it is not printing.
+IDLE_POLL_INTERVAL_TD = timedelta(seconds=POLL_INTERVAL * 6)
+STATUS_CACHE_TTL = 3  # seconds
+SYSINFO_CACHE_TTL = 600  # seconds
+MAX_STALE_EXTRAS = 300  # seconds
+OFFLINE_MAX_POLL_INTERVAL = 300  # seconds
 ANYCUBIC_WIFI_PORT = 6000
 CONFIG_FLOW_VERSION = 1
 UART_WIFI_PROTOCOL = "Anycubic Uart Wifi Protocol"
@@ -35,6 +51,9 @@ TYPE_FLOAT = "float"
 TYPE_FILE = "file"
 INTERNAL_FILE = "Internal File Name"
 STATUS_OFFLINE = MonoXStatus(["getstatus", "offline"])
+ATTR_CURRENT_LAYER = "Current Layer"
+ATTR_TOTAL_LAYERS = "Total Layers"
+ATTR_LAST_GOOD = "Last Good"
 ATTR_REMAINING_LAYERS = "Layers Remaining"
 ATTR_TOTAL_TIME = "Total Print Time"
 
@@ -42,32 +61,48 @@ ATTR_TOTAL_TIME = "Total Print Time"
 UNIT_HMS = f"{UnitOfTime.HOURS}:{UnitOfTime.MINUTES}:{UnitOfTime.SECONDS}"
 
 # The following are the keys for the lookup table
-# [sensor value name, display name, data type, unit]
-ATTR_LOOKUP_TABLE = [
-    ["file", "file", TYPE_FILE, ""],
-    ["current_layer", "Current Layer", TYPE_INT, ""],
-    ["total_layers", "Total Layers", TYPE_INT, ""],
-    ["layer_height", "Layer Height", TYPE_FLOAT, UnitOfLength.MILLIMETERS],
-    ["percent_complete", "% Complete", TYPE_INT, PERCENTAGE],
-    ["seconds_elapse", "Time Elapsed", TYPE_TIME, UNIT_HMS],
-    ["seconds_remaining", "Time Remaining", TYPE_TIME, UNIT_HMS],
-    ["total_volume", "Print Volume", TYPE_ML, UnitOfVolume.MILLILITERS],
-    ["mode", "Mode", TYPE_STRING, ""],  # Mode is always UV
-    ["unknown1", "unknown_1", TYPE_FLOAT, ""],
-    ["unknown2", "unknown_2", TYPE_STRING, ""],
-    [ATTR_REMAINING_LAYERS, ATTR_REMAINING_LAYERS, TYPE_TIME, ""],
-    [ATTR_TOTAL_TIME, ATTR_TOTAL_TIME, TYPE_TIME, UNIT_HMS],
-]
+# (sensor value name, display name, data type, unit)
+# The names are interned since they are used as dict keys on every poll.
+ATTR_LOOKUP_TABLE = tuple(
+    (sys.intern(api_name), sys.intern(hass_name), data_type, unit)
+    for api_name, hass_name, data_type, unit in (
+        ("file", "file", TYPE_FILE, ""),
+        ("current_layer", ATTR_CURRENT_LAYER, TYPE_INT, ""),
+        ("total_layers", ATTR_TOTAL_LAYERS, TYPE_INT, ""),
+        ("layer_height", "Layer Height", TYPE_FLOAT, UnitOfLength.MILLIMETERS),
+        ("percent_complete", "% Complete", TYPE_INT, PERCENTAGE),
+        ("seconds_elapse", "Time Elapsed", TYPE_TIME, UNIT_HMS),
+        ("seconds_remaining", "Time Remaining", TYPE_TIME, UNIT_HMS),
+        ("total_volume", "Print Volume", TYPE_ML, UnitOfVolume.MILLILITERS),
+        ("mode", "Mode", TYPE_STRING, ""),  # Mode is always UV
+        ("unknown1", "unknown_1", TYPE_FLOAT, ""),
+        ("unknown2", "unknown_2", TYPE_STRING, ""),
+        (ATTR_REMAINING_LAYERS, ATTR_REMAINING_LAYERS, TYPE_TIME, ""),
+        (ATTR_TOTAL_TIME, ATTR_TOTAL_TIME, TYPE_TIME, UNIT_HMS),
+    )
+)
 
 CONVERT_SECONDS_MODEL = "Mono X 6K"
 OPT_NO_EXTRA_DATA = "no_extras"
 OPT_HIDE_IP = "hide_ip"
 OPT_HIDE_EXTRA_SENSORS = "hide_extra_sensors"
 OPT_USE_PICTURE = "use_picture"
+OPT_CLOSE_CONNECTION = "close_connection"
+DEFAULT_OPTIONS = MappingProxyType(
+    {
+        OPT_HIDE_IP: False,
+        OPT_NO_EXTRA_DATA: False,
+        OPT_HIDE_EXTRA_SENSORS: False,
+        OPT_USE_PICTURE: False,
+        OPT_CLOSE_CONNECTION: False,
+    }
+)
 API_MODEL = "model"
 API_SERIAL = "serial"
 API_FIRMWARE = "firmware"
 API_STATUS = "status"
+API_STATUS_STOP = "stop"
 API_SECONDS_ELAPSE = "seconds_elapse"
+API_SECONDS_REMAINING = "seconds_remaining"
 API_TILDE = "~"
 API_VALUE_SPLIT_CHAR = "/"
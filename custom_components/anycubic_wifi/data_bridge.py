@@ -1,22 +1,29 @@
 """Update coordinator"""
 from datetime import timedelta
+from functools import cached_property
 import logging
+import time
 from typing import cast
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.const import CONF_MODEL, ATTR_SW_VERSION, CONF_HOST
+from homeassistant.const import CONF_MODEL, ATTR_SW_VERSION
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 from uart_wifi.errors import ConnectionException
 
 from .errors import AnycubicException
 from .const import (
+    API_STATUS_STOP,
     CONF_SERIAL,
+    IDLE_POLL_INTERVAL_TD,
+    OFFLINE_MAX_POLL_INTERVAL,
     POLL_INTERVAL,
+    POLL_INTERVAL_TD,
     ATTR_MANUFACTURER,
     DOMAIN,
     STATUS_OFFLINE,
@@ -38,9 +45,13 @@ class AnycubicDataBridge(DataUpdateCoordinator):
     also responsible for handling the errors that may occur during the update
     process."""
 
-    # Reported status extras is parsed from the status object and contains
-    # extra state attributes for the sensor.
-    _reported_status_extras: dict = {}
+    # Monotonic time of the last poll which provided status extras. This is
+    # used to decide how long the extras are reported while the device is
+    # offline.
+    _last_good_ts: float = 0.0
+
+    # The wall clock time of the same poll, reported alongside the extras.
+    _last_good_time: str | None = None
 
     # Certain MonoX devices measure elapsed time in seconds, while others
     # measure time in minutes.
@@ -76,13 +87,20 @@ class AnycubicDataBridge(DataUpdateCoordinator):
             _LOGGER,
             name=f"anycubic-{monox.ip_address}",
             update_method=self._async_update_data,
-            update_interval=timedelta(seconds=POLL_INTERVAL),
+            update_interval=POLL_INTERVAL_TD,
         )
         self._config_entry = config_entry
         self._monox = monox
+        # Reported status extras is parsed from the status object and
+        # contains extra state attributes for the sensor. Each printer has
+        # its own, so it must not be shared between bridges.
+        self._reported_status_extras: dict = {}
+        self._connection_retries = 0
         self._convert_seconds = (
             CONVERT_SECONDS_MODEL in config_entry.data[CONF_MODEL]
         )
+        # Options changes reload the entry, so the option is read once.
+        self._no_extras: bool = config_entry.options[OPT_NO_EXTRA_DATA]
 
     async def _async_update_data(self):
         """Update data via API. On the first sync this method will provide
@@ -93,17 +111,25 @@ class AnycubicDataBridge(DataUpdateCoordinator):
         unavailble."""
         ex = None
         try:
-            [current_status, extras] = self._monox.get_current_status(
+            monox = self._monox
+            [current_status, extras] = await monox.async_get_current_status(
                 convert_seconds=self._convert_seconds,
-                no_extras=self._config_entry.options[OPT_NO_EXTRA_DATA],
+                no_extras=self._no_extras,
             )
             if current_status:
-                # We have connection, so we can reset the connection retries.
+                # We have connection, so we can reset the connection retries
+                # and poll at the rate suited to what the printer is doing.
+                # Should the printer stop answering, the backoff in
+                # debounce_failure_response starts from this interval.
                 self._connection_retries = 0
+                self.update_interval = (
+                    IDLE_POLL_INTERVAL_TD
+                    if current_status.status.strip() == API_STATUS_STOP
+                    else POLL_INTERVAL_TD
+                )
 
                 # Depending on user selected options, we store data in extras.
                 self._maybe_record_status_extras(extras)
-                self._maybe_add_host_to_extras()
 
                 # Home assistant automatically stores this as the
                 # hass.data['unique_id']['status'] and we pick it up
@@ -121,8 +147,10 @@ class AnycubicDataBridge(DataUpdateCoordinator):
         return self.debounce_failure_response(ex)
 
     def _maybe_record_status_extras(self, extras):
-        if not self._config_entry.options[OPT_NO_EXTRA_DATA]:
+        if not self._no_extras:
             self._reported_status_extras.update(extras)
+            self._last_good_ts = time.monotonic()
+            self._last_good_time = dt_util.utcnow().isoformat()
 
     def debounce_failure_response(self, execption: Exception):
         """Debounce the data bridge.  These devices have very poor wifi
@@ -131,8 +159,23 @@ class AnycubicDataBridge(DataUpdateCoordinator):
         problems when the device is not responsive for a while. I've
         observed 250 failures in a 16 hour period, polling at a 10 second
         interval with the wifi router located within 5 feet of the device.
+        While the device keeps failing, the poll interval is doubled on each
+        failure up to OFFLINE_MAX_POLL_INTERVAL so an unreachable printer is
+        not contacted every few seconds. A failure never shortens the
+        interval, so a printer which drops off while idle is not polled more
+        often than it was while it answered. Polls that far apart are not
+        worth holding a connection open for, so it is released.
         """
         self._connection_retries += 1
+        if self._connection_retries > 1:
+            self._monox.close_if_idle()
+            backoff = timedelta(
+                seconds=min(
+                    POLL_INTERVAL * 2 ** (self._connection_retries - 1),
+                    OFFLINE_MAX_POLL_INTERVAL,
+                )
+            )
+            self.update_interval = max(self.update_interval, backoff)
         if self._connection_retries > 5:
             if execption is not None:
                 raise UpdateFailed(
@@ -149,21 +192,23 @@ class AnycubicDataBridge(DataUpdateCoordinator):
         online."""
         return self._connection_retries < 6
 
-    def _maybe_add_host_to_extras(self):
-        """If the extra data does not already contain the host, add it.
-        This is used to provide the host to the sensor extras."""
-        if not self._config_entry.options[OPT_NO_EXTRA_DATA] and not hasattr(
-            self._reported_status_extras, CONF_HOST
-        ):
-            self._reported_status_extras.update(
-                {CONF_HOST: self._monox.ip_address}
-            )
-
     def get_last_status_extras(self):
         """Provide a public method to give the last status extras for the
         sensor."""
         return self._reported_status_extras
 
+    def get_stale_seconds(self) -> float | None:
+        """Provide the number of seconds since the last status extras were
+        recorded, or None if they have never been recorded."""
+        if not self._last_good_ts:
+            return None
+        return time.monotonic() - self._last_good_ts
+
+    def get_last_good_time(self) -> str | None:
+        """Provide the ISO formatted time at which the last status extras
+        were recorded, or None if they have never been recorded."""
+        return self._last_good_time
+
     def get_printer(self):
         """Return the printer api for diagnostics."""
         return self._monox
@@ -175,26 +220,27 @@ class AnycubicDataBridge(DataUpdateCoordinator):
         """
         return self._connection_retries == 0
 
-    @property
+    @cached_property
     def device_info(self) -> DeviceInfo:
         """Device info. This implements all the required attributes for the
         device object. The device object is used by Home Assistant to provide
         information about the device in the UI and in the Device Registry.
+        The entry data only changes on reload, so this is built once.
         """
         unique_id = cast(str, self.config_entry.unique_id)
 
         try:
+            data = self.config_entry.data
             return DeviceInfo(
                 identifiers={(DOMAIN, unique_id)},
                 manufacturer=ATTR_MANUFACTURER,
                 suggested_area=SUGGESTED_AREA,
-                sw_version=self.config_entry.data[ATTR_SW_VERSION],
-                model=self.config_entry.data[CONF_MODEL],
-                name=ATTR_MANUFACTURER
-                + " "
-                + self.config_entry.data[CONF_MODEL]
-                + " "
-                + self.config_entry.data[CONF_SERIAL][-4:4],
+                sw_version=data[ATTR_SW_VERSION],
+                model=data[CONF_MODEL],
+                name=(
+                    f"{ATTR_MANUFACTURER} {data[CONF_MODEL]}"
+                    f" {data[CONF_SERIAL][-4:]}"
+                ),
             )
 
         except AttributeError as ex:
@@ -2,7 +2,7 @@
 from __future__ import annotations
 import json
 import logging
-from types import NoneType
+from types import MappingProxyType, NoneType
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from .data_bridge import AnycubicDataBridge
@@ -11,6 +11,9 @@ from .const import DOMAIN
 # Logger for the class
 _LOGGER = logging.getLogger(__name__)
 
+# Values of these types are always serializable, so they skip the JSON probe.
+_JSON_SCALARS = (str, int, float, bool, NoneType)
+
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, config_entry: ConfigEntry
@@ -18,9 +21,8 @@ async def async_get_config_entry_diagnostics(
     """Return diagnostics for a config entry. Here we dump everything
     we know about the config entry, integration, and the data bridge.
     This makes it easier to audit the data and debug issues."""
-    bridge: AnycubicDataBridge = hass.data[DOMAIN][config_entry.entry_id][
-        "coordinator"
-    ]
+    entry_location = hass.data[DOMAIN][config_entry.entry_id]
+    bridge: AnycubicDataBridge = entry_location["coordinator"]
 
     entry_data = {}
     entry_data["config_entry"] = {
@@ -32,15 +34,14 @@ async def async_get_config_entry_diagnostics(
         "data": safe_dump(config_entry.data),
         "options": safe_dump(config_entry.options),
     }
-    entry_data["data"] = safe_dump(config_entry.data)
-    entry_data["options"] = safe_dump(config_entry.options)
     entry_data["extra_state_data"] = safe_dump(bridge.get_last_status_extras())
     data_bridge = safe_dump(bridge)
     data_bridge["data"] = safe_dump(bridge.data)
     diagnostics_data = {
         config_entry.entry_id: {
-            "config_entry_data": safe_dump(entry_data),
-            "hass data": safe_dump(hass.data[DOMAIN][config_entry.entry_id]),
+            # The entry data is built from dumped values, so it is ready.
+            "config_entry_data": entry_data,
+            "hass data": safe_dump(entry_location),
             "anycubic_data_bridge": data_bridge,
         }
     }
@@ -58,18 +59,18 @@ def safe_dump(the_object):
     _LOGGER.debug("Dumping object: %s %s", the_object, type(the_object))
     if isinstance(the_object, (int, float, str, bool, complex, NoneType)):
         return the_object
-    elif str(the_object.__class__) in [
-        "<class 'mappingproxy'>",
-        "<class 'dict'>",
-    ]:
+    elif isinstance(the_object, (dict, MappingProxyType)):
         the_dict = the_object
     else:
         the_dict = the_object.__dict__
     new_dict = {}
-    for key in the_dict:
+    for key, value in the_dict.items():
+        if isinstance(value, _JSON_SCALARS):
+            new_dict[key] = value
+            continue
         try:
-            json.dumps(the_dict.get(key))
-            new_dict.update({key: the_dict.get(key)})
+            json.dumps(value)
+            new_dict[key] = value
         except (AttributeError, TypeError, OverflowError):
-            new_dict.update({key: str(the_dict.get(key))})
+            new_dict[key] = str(value)
     return new_dict
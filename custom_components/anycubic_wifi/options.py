@@ -5,10 +5,21 @@ from homeassistant import config_entries
 from homeassistant.data_entry_flow import FlowResult
 import voluptuous as vol
 from .const import (
+    DEFAULT_OPTIONS,
     OPT_HIDE_IP,
     OPT_NO_EXTRA_DATA,
     OPT_HIDE_EXTRA_SENSORS,
     OPT_USE_PICTURE,
+    OPT_CLOSE_CONNECTION,
+)
+
+# The options shown to the user, in the order they appear in the form.
+_OPTION_KEYS = (
+    OPT_HIDE_EXTRA_SENSORS,
+    OPT_NO_EXTRA_DATA,
+    OPT_HIDE_IP,
+    OPT_USE_PICTURE,
+    OPT_CLOSE_CONNECTION,
 )
 
 
@@ -29,30 +40,16 @@ class AnycubicOptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="asdfasdf", data=user_input)
 
+        options = self.config_entry.options
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(
                 {
                     vol.Required(
-                        OPT_HIDE_EXTRA_SENSORS,
-                        default=self.config_entry.options.get(
-                            OPT_HIDE_EXTRA_SENSORS
-                        ),
-                    ): bool,
-                    vol.Required(
-                        OPT_NO_EXTRA_DATA,
-                        default=self.config_entry.options.get(
-                            OPT_NO_EXTRA_DATA
-                        ),
-                    ): bool,
-                    vol.Required(
-                        OPT_HIDE_IP,
-                        default=self.config_entry.options.get(OPT_HIDE_IP),
-                    ): bool,
-                    vol.Required(
-                        OPT_USE_PICTURE,
-                        default=self.config_entry.options.get(OPT_USE_PICTURE),
-                    ): bool,
+                        option,
+                        default=options.get(option, DEFAULT_OPTIONS[option]),
+                    ): bool
+                    for option in _OPTION_KEYS
                 },
             ),
         )
@@ -6,11 +6,10 @@
 #               sensor entity
 
 from __future__ import annotations
-from datetime import timedelta
 
 import logging
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.components.sensor import SensorEntity
 from .data_bridge import AnycubicDataBridge
@@ -21,12 +20,8 @@ from .const import (
     DOMAIN,
     OPT_HIDE_EXTRA_SENSORS,
     PRINTER_ICON,
-    POLL_INTERVAL,
 )
 
-# The time interval between scans
-SCAN_INTERVAL = timedelta(seconds=POLL_INTERVAL)
-
 # Logger for this class.
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,53 +41,33 @@ async def async_setup_entry(
         "coordinator"
     ]
 
-    @callback
-    async def async_add_sensor() -> None:
-        """Add sensor from Anycubic device into the Home Assistant entity
-        registry."""
-        name = "status"
-        async_add_entities(
-            [
-                MonoXSensor(
-                    bridge=coordinator,
-                    hass=hass,
-                    entry=entry,
-                    native_update=name,
-                    name=name,
-                )
-            ]
-        )
-
-    async def async_add_extra_sensor(
-        sensor: str,
-        name: str,
-        unit: str,
-    ) -> None:
-        """Add sensor from Anycubic device into the Home Assistant entity
-        registry. This is used for the extra sensors which are sub-messages
-        of the primary message received by the device.  These sensors literally
-        do not exist when the printer is in "stopped" or "finished" state.
-        :param sensor: The queriable extra-data portion of the sensor.
-        :param name: The name of the sensor.
-        :param unit: The unit of the sensor."""
-
-        async_add_entities(
-            [
-                MonoXExtraSensor(
-                    bridge=coordinator,
-                    hass=hass,
-                    entry=entry,
-                    native_update=sensor,
-                    name=name,
-                    unit=unit,
-                )
-            ]
+    name = "status"
+    entities: list[MonoXSensor] = [
+        MonoXSensor(
+            bridge=coordinator,
+            hass=hass,
+            entry=entry,
+            native_update=name,
+            name=name,
         )
-
-    await async_add_sensor()
+    ]
     if not entry.options.get(OPT_HIDE_EXTRA_SENSORS):
-        for [sensor, name, _, unit] in ATTR_LOOKUP_TABLE:
-            await async_add_extra_sensor(sensor, name, unit)
+        # The extra sensors are sub-messages of the primary message received
+        # by the device.  These sensors literally do not exist when the
+        # printer is in "stopped" or "finished" state.
+        entities.extend(
+            MonoXExtraSensor(
+                bridge=coordinator,
+                hass=hass,
+                entry=entry,
+                native_update=sensor,
+                name=name,
+                unit=unit,
+            )
+            for sensor, name, _, unit in ATTR_LOOKUP_TABLE
+        )
+    # All of the sensors are registered with Home Assistant in one call.
+    async_add_entities(entities)
 
 
 class MonoXSensor(AnycubicEntityBaseDecorator, SensorEntity):
@@ -107,8 +82,9 @@ class MonoXSensor(AnycubicEntityBaseDecorator, SensorEntity):
     """
 
     _attr_icon = PRINTER_ICON
-    should_poll = True
-    async_update_interval = SCAN_INTERVAL
+    # The data bridge is the only poller. Entities are written when it
+    # reports new data, rather than being polled on their own timer.
+    should_poll = False
 
     def __init__(
         self,
@@ -138,10 +114,6 @@ class MonoXSensor(AnycubicEntityBaseDecorator, SensorEntity):
         self._attr_state = self.bridge.data.status
         return self._attr_state
 
-    async def async_update(self):
-        """Update the sensor value when requested by Home Assistant."""
-        return self.native_value
-
 
 class MonoXExtraSensor(MonoXSensor):
     """A sensor with extra data. This sensor is a wrapper around the Anycubic
@@ -149,36 +121,12 @@ class MonoXExtraSensor(MonoXSensor):
     handle outputting the sensor data into the user interface. It includes
     SensorEntity methods to implement standard sensor functionality."""
 
-    def __init__(
-        self,
-        bridge: AnycubicDataBridge,
-        hass: HomeAssistant,
-        entry: ConfigEntry,
-        native_update: str,
-        name: str,
-        unit: str,
-    ) -> None:
-        """Initialize the sensor. We override the name of the sensor to be the
-        name of the attribute. This is done to make it easier to identify the
-        sensor in the UI."""
-        super().__init__(
-            bridge=bridge,
-            hass=hass,
-            entry=entry,
-            native_update=native_update,
-            name=name,
-            unit=unit,
-        )
-
     @property
     def native_value(self):
         """Return sensor state. Since this value is not processed, and delivered
         directly to the sensor, it is considered a native value.  This can be
         overridden by home assistant user to provide a custom value."""
-        extras = self.bridge.get_last_status_extras()
-        if self.sensor_attr_name in extras:
-            return extras[self.sensor_attr_name]
-        return None
+        return self.bridge.get_last_status_extras().get(self.sensor_attr_name)
 
     @property
     def state(self):
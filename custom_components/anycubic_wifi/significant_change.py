@@ -5,12 +5,17 @@ from homeassistant.core import callback, HomeAssistant
 
 @callback
 def async_check_significant_change(
-    hass: HomeAssistant, old_state: str, new_state: str, _: Any, **kwargs: Any
+    hass: HomeAssistant,
+    old_state: str,
+    old_attrs: dict,
+    new_state: str,
+    new_attrs: dict,
+    **kwargs: Any,
 ) -> Optional[bool]:
     """Significant Change Support. Insignificant changes are attributes only.
     :old_state: the previous state of the sensor.
+    :old_attrs: the previous attributes of the sensor, which are ignored.
     :new_state: the current state of the sensor
+    :new_attrs: the current attributes of the sensor, which are ignored.
     :return: true if new state is different than old state."""
-    if old_state != new_state:
-        return True
-    return False
+    return old_state != new_state
@@ -0,0 +1,13 @@
+"""Test configuration for the Anycubic 3D Printer tests."""
+
+from importlib.util import find_spec
+
+# The integration package cannot be imported without Home Assistant. Without
+# it, only the tests which talk to the fake printer directly are collected.
+if find_spec("homeassistant") is None:
+    collect_ignore = [
+        "test_adapter.py",
+        "test_config_flow.py",
+        "test_data_bridge.py",
+        "test_significant_change.py",
+    ]
@@ -0,0 +1,109 @@
+"""A fake printer for the tests which is listening as soon as it exists."""
+
+import select
+import socket
+import threading
+
+from uart_wifi.simulate_printer import AnycubicSimulator
+
+# A request which is answered with part of a status message, after which the
+# connection is left open, as a printer which stopped mid-message would.
+PARTIAL_REQUEST = "partial,"
+PARTIAL_RESPONSE = "getstatus,print,Widget.pwmb"
+
+
+class BoundSimulator(AnycubicSimulator):
+    """The uart_wifi simulator binds and listens inside of start_server, so
+    the port is only known, and connections are only accepted, some time
+    after the server thread starts. This simulator binds and listens when it
+    is constructed, on the calling thread. The port is known immediately and
+    connections made before the accept loop runs wait in the listen backlog.
+
+    The uart_wifi simulator answers a single request and then closes the
+    connection. When hold_connections is set, this simulator answers every
+    request on a connection until the client closes it, as the printer does.
+    """
+
+    def __init__(
+        self, the_ip: str, the_port: int = 0, hold_connections: bool = False
+    ) -> None:
+        """Bind and listen on the address.
+        :the_ip: The IP address to listen on. eg. 127.0.0.1
+        :the_port: The port to listen on, or 0 for any free port.
+        :hold_connections: If true, connections are held open between
+        requests.
+        """
+        super().__init__(the_ip, the_port)
+        # The shutdown signal is shared by every simulator, so a previous
+        # test may have left it set.
+        AnycubicSimulator.shutdown_signal = False
+        self.hold_connections = hold_connections
+        self.accepted = 0
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._server = socket.create_server((the_ip, the_port))
+        self.port = self._server.getsockname()[1]
+
+    def start_server(self):
+        """Accept connections on the bound socket until shutdown. Each
+        connection is answered on its own thread, as the uart_wifi simulator
+        does."""
+        with self._server:
+            while not AnycubicSimulator.shutdown_signal:
+                readable, [], [] = select.select([self._server], [], [], 0.1)
+                if readable:
+                    conn, addr = self._server.accept()
+                    self.accepted += 1
+                    thread = threading.Thread(
+                        target=self.response_selector,
+                        args=(conn, addr),
+                    )
+                    thread.daemon = True
+                    thread.start()
+
+    def start(self) -> threading.Thread:
+        """Run the accept loop on a daemon thread.
+        :returns: the thread running the accept loop."""
+        self._thread = threading.Thread(target=self.start_server)
+        self._thread.daemon = True
+        self._thread.start()
+        return self._thread
+
+    def shutdown(self) -> None:
+        """Stop the accept loop and release any stalled connections."""
+        AnycubicSimulator.shutdown_signal = True
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def response_selector(self, conn: socket.socket, addr) -> None:
+        """The connection handler. Unless connections are held, this is the
+        uart_wifi handler, which answers one request.
+        :conn: The connection to use
+        :addr: address tuple for ip and port
+        """
+        if not self.hold_connections:
+            super().response_selector(conn, addr)
+            return
+        received = ""
+        with conn:
+            while not AnycubicSimulator.shutdown_signal:
+                data = conn.recv(1024)
+                if not data:
+                    return
+                received += data.decode()
+                while "," in received:
+                    request, _, received = received.partition(",")
+                    self.send_response(conn, request.strip() + ",")
+
+    def send_response(self, conn: socket.socket, decoded_data: str) -> None:
+        """Send a response, adding the partial message request to the
+        uart_wifi responses.
+        :conn: The connection to use
+        :decoded_data: the request received.
+        """
+        if decoded_data.strip() == PARTIAL_REQUEST:
+            conn.sendall(PARTIAL_RESPONSE.encode())
+            self._stopped.wait()
+            return
+        super().send_response(conn, decoded_data)
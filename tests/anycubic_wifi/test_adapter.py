@@ -0,0 +1,150 @@
+"""The tests for the connection handling of the API adapter fascade."""
+
+import asyncio
+
+import pytest
+from uart_wifi.errors import ConnectionException
+from uart_wifi.response import MonoXStatus
+from custom_components.anycubic_wifi import adapter_fascade
+from custom_components.anycubic_wifi.adapter_fascade import MonoXAPIAdapter
+from fake_printer import BoundSimulator, PARTIAL_REQUEST, PARTIAL_RESPONSE
+
+
+def start_printer(hold_connections: bool = False) -> BoundSimulator:
+    """Start a fake printer for a test.
+    :hold_connections: If true, the fake printer keeps connections open.
+    :returns: the running fake printer."""
+    fake_printer = BoundSimulator(
+        "127.0.0.1", hold_connections=hold_connections
+    )
+    fake_printer.start()
+    return fake_printer
+
+
+@pytest.fixture(name="printer")
+def fixture_printer():
+    """A fake printer which answers one request per connection, then closes
+    it, as the uart_wifi simulator does."""
+    fake_printer = start_printer()
+    yield fake_printer
+    fake_printer.shutdown()
+
+
+@pytest.fixture(name="holding_printer")
+def fixture_holding_printer():
+    """A fake printer which keeps connections open between requests."""
+    fake_printer = start_printer(hold_connections=True)
+    yield fake_printer
+    fake_printer.shutdown()
+
+
+def get_adapter(fake_printer: BoundSimulator, **kwargs) -> MonoXAPIAdapter:
+    """Get an adapter connected to the fake printer."""
+    return MonoXAPIAdapter(f"127.0.0.1:{fake_printer.port}", **kwargs)
+
+
+def get_status(adapter: MonoXAPIAdapter) -> MonoXStatus:
+    """Request the status and return the first response."""
+    response = adapter.send_request("getstatus,\r\n")
+    assert len(response) > 0, "No response from Fake Printer"
+    return response[0]
+
+
+def test_connection_is_reused(holding_printer: BoundSimulator):
+    """A held connection answers the following request."""
+    adapter = get_adapter(holding_printer, keep_alive=True)
+    assert get_status(adapter).status == "stop\r\n"
+    held = adapter._socket  # pylint: disable=protected-access
+    assert held is not None
+    assert get_status(adapter).status == "stop\r\n"
+    assert adapter._socket is held  # pylint: disable=protected-access
+    assert holding_printer.accepted == 1
+    adapter.close()
+
+
+def test_reconnects_after_printer_drops_connection(printer: BoundSimulator):
+    """The fake printer closes the connection after each response, so the
+    held connection fails on the next request, which is sent once more on a
+    new connection."""
+    adapter = get_adapter(printer, keep_alive=True)
+    assert get_status(adapter).status == "stop\r\n"
+    dropped = adapter._socket  # pylint: disable=protected-access
+    assert dropped is not None
+    assert get_status(adapter).status == "stop\r\n"
+    assert adapter._socket is not dropped  # pylint: disable=protected-access
+    assert printer.accepted == 2
+    adapter.close()
+
+
+def test_partial_response_closes_connection(holding_printer: BoundSimulator):
+    """A connection which stopped partway through a message is not reused,
+    so the rest of the message is not read as the next response."""
+    adapter = get_adapter(holding_printer, keep_alive=True)
+    adapter.set_raw()
+    adapter.set_maximum_request_time(0.2)
+    assert adapter.send_request(PARTIAL_REQUEST) == PARTIAL_RESPONSE
+    assert adapter._socket is None  # pylint: disable=protected-access
+
+
+def test_connection_closed_without_keep_alive(holding_printer: BoundSimulator):
+    """Without keep_alive, the connection is closed after every request."""
+    adapter = get_adapter(holding_printer)
+    assert get_status(adapter).status == "stop\r\n"
+    assert adapter._socket is None  # pylint: disable=protected-access
+    assert get_status(adapter).status == "stop\r\n"
+    assert holding_printer.accepted == 2
+
+
+def test_close(holding_printer: BoundSimulator):
+    """Closing the adapter releases the held connection."""
+    adapter = get_adapter(holding_printer, keep_alive=True)
+    get_status(adapter)
+    assert adapter._socket is not None  # pylint: disable=protected-access
+    adapter.close()
+    assert adapter._socket is None  # pylint: disable=protected-access
+
+
+def test_unreachable_printer():
+    """A printer which refuses the connection raises ConnectionException."""
+    fake_printer = BoundSimulator("127.0.0.1")
+    port = fake_printer.port
+    # Close the listening socket without ever accepting on it.
+    fake_printer._server.close()  # pylint: disable=protected-access
+    adapter = MonoXAPIAdapter(f"127.0.0.1:{port}", keep_alive=True)
+    with pytest.raises(ConnectionException):
+        get_status(adapter)
+    assert adapter._socket is None  # pylint: disable=protected-access
+
+
+def test_idle_connection_is_closed(
+    holding_printer: BoundSimulator, monkeypatch: pytest.MonkeyPatch
+):
+    """A held connection is closed once it has been idle for the keep alive
+    timeout, without waiting for the next request."""
+    monkeypatch.setattr(adapter_fascade, "KEEP_ALIVE_IDLE_TIMEOUT", 0.05)
+    adapter = get_adapter(holding_printer, keep_alive=True)
+
+    async def poll_then_wait():
+        await adapter.async_get_current_status(False, True)
+        assert adapter._socket is not None  # pylint: disable=protected-access
+        await asyncio.sleep(0.2)
+
+    asyncio.run(poll_then_wait())
+    assert adapter._socket is None  # pylint: disable=protected-access
+
+
+def test_async_close_cancels_idle_close(holding_printer: BoundSimulator):
+    """Closing the adapter from the event loop closes the connection and
+    cancels the scheduled close, so nothing holds on to the adapter."""
+    adapter = get_adapter(holding_printer, keep_alive=True)
+
+    async def poll_then_close():
+        await adapter.async_get_current_status(False, True)
+        idle_close = adapter._idle_close  # pylint: disable=protected-access
+        assert idle_close is not None
+        await adapter.async_close()
+        assert idle_close.cancelled()
+        assert adapter._idle_close is None  # pylint: disable=protected-access
+
+    asyncio.run(poll_then_close())
+    assert adapter._socket is None  # pylint: disable=protected-access
@@ -0,0 +1,53 @@
+"""The tests for the config flow of the integration."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from uart_wifi.errors import ConnectionException
+
+from homeassistant.components.dhcp import DhcpServiceInfo
+from homeassistant.const import CONF_HOST
+from custom_components.anycubic_wifi.config_flow import (
+    MyConfigFlowHandler,
+)
+from custom_components.anycubic_wifi.const import CONF_DHCP
+
+
+def get_flow(duplicates: AsyncMock) -> MyConfigFlowHandler:
+    """Get a config flow which checks for duplicates with the mock rather
+    than asking the printer."""
+    flow = MyConfigFlowHandler()
+    flow.async_step_duplicates = duplicates
+    return flow
+
+
+def test_dhcp_discovery_shows_confirmation():
+    """A discovered device is checked for duplicates once, then shown to the
+    user to confirm without asking the device again."""
+    duplicates = AsyncMock(return_value=True)
+    flow = get_flow(duplicates)
+    discovery_info = DhcpServiceInfo(
+        ip="192.168.1.254", hostname="uart-wifi", macaddress="286dcd000000"
+    )
+    result = asyncio.run(flow.async_step_dhcp(discovery_info))
+    discovered_information = {CONF_HOST: "192.168.1.254", CONF_DHCP: True}
+    duplicates.assert_awaited_once_with(discovered_information)
+    assert result["type"] == "form"
+    assert result["step_id"] == "user"
+    assert result["description_placeholders"] == discovered_information
+    assert result["errors"] is None
+
+
+@pytest.mark.parametrize(
+    "error",
+    [ValueError(), ConnectionException("Could not connect")],
+)
+def test_connection_error_shows_form_with_error(error: Exception):
+    """When the device cannot be reached, the form is shown again with a
+    connection error."""
+    flow = get_flow(AsyncMock(side_effect=error))
+    result = asyncio.run(flow.async_step_user({CONF_HOST: "192.168.1.254"}))
+    assert result["type"] == "form"
+    assert result["step_id"] == "user"
+    assert result["errors"] == {"base": "connection_error"}
@@ -0,0 +1,218 @@
+"""The tests for the polling schedule of the data bridge."""
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from uart_wifi.errors import ConnectionException
+from uart_wifi.response import MonoXStatus
+
+from homeassistant.const import (
+    ATTR_SW_VERSION,
+    CONF_HOST,
+    CONF_MODEL,
+)
+from homeassistant.helpers.update_coordinator import (
+    UpdateFailed,
+)
+from custom_components.anycubic_wifi.adapter_fascade import (
+    MonoXAPIAdapter,
+)
+from custom_components.anycubic_wifi.const import (
+    ATTR_LAST_GOOD,
+    CONF_SERIAL,
+    IDLE_POLL_INTERVAL_TD,
+    KEEP_ALIVE_IDLE_TIMEOUT,
+    OFFLINE_MAX_POLL_INTERVAL,
+    OPT_HIDE_EXTRA_SENSORS,
+    OPT_HIDE_IP,
+    OPT_NO_EXTRA_DATA,
+    OPT_USE_PICTURE,
+    POLL_INTERVAL_TD,
+)
+from custom_components.anycubic_wifi.data_bridge import (
+    AnycubicDataBridge,
+)
+from custom_components.anycubic_wifi.sensor import MonoXSensor
+
+PRINTING = MonoXStatus(["getstatus", "print", "Widget.pwmb/46.pwmb"])
+STOPPED = MonoXStatus(["getstatus", "stop\r\n"])
+
+
+class FakePrinter:
+    """Stands in for the API adapter. Until it is given a status to report,
+    every status request fails."""
+
+    ip_address = "127.0.0.1"
+
+    def __init__(self) -> None:
+        """Start out unreachable."""
+        self.status: MonoXStatus | None = None
+        self.extras: dict = {}
+        self.closed = 0
+
+    async def async_get_current_status(
+        self, convert_seconds: bool, no_extras: bool
+    ):
+        """Report the status, or fail as an unreachable printer does."""
+        if self.status is None:
+            raise ConnectionException("Could not connect to AnyCubic printer")
+        return (self.status, self.extras)
+
+    def close_if_idle(self) -> None:
+        """Record that the connection was released."""
+        self.closed += 1
+
+
+def get_entry() -> SimpleNamespace:
+    """Get a config entry which reports the extras as attributes."""
+    return SimpleNamespace(
+        entry_id="entry",
+        unique_id="234234234",
+        data={
+            CONF_HOST: "127.0.0.1",
+            CONF_MODEL: "Photon Mono X",
+            CONF_SERIAL: "234234234",
+            ATTR_SW_VERSION: "V0.2.2",
+        },
+        options={
+            OPT_HIDE_EXTRA_SENSORS: True,
+            OPT_HIDE_IP: False,
+            OPT_NO_EXTRA_DATA: False,
+            OPT_USE_PICTURE: False,
+        },
+    )
+
+
+def get_bridge(printer) -> AnycubicDataBridge:
+    """Get a data bridge polling the printer."""
+    entry = get_entry()
+    bridge = AnycubicDataBridge(MagicMock(), printer, entry)
+    # Home Assistant provides the entry to the bridge while setting it up.
+    bridge.config_entry = entry
+    return bridge
+
+
+def poll(bridge: AnycubicDataBridge) -> timedelta:
+    """Run one update of the data bridge, storing the data as Home Assistant
+    does.
+    :returns: the interval until the next update."""
+    try:
+        # pylint: disable-next=protected-access
+        bridge.data = asyncio.run(bridge._async_update_data())
+    except UpdateFailed:
+        bridge.data = None
+    return bridge.update_interval
+
+
+def seconds(*values: int) -> list[timedelta]:
+    """Convert the values to intervals."""
+    return [timedelta(seconds=value) for value in values]
+
+
+def test_idle_poll_reuses_connection():
+    """An idle poll arrives before a held connection times out, even after
+    a request which took as long as allowed, so it is reused rather than
+    closed and opened again."""
+    longest_gap = (
+        IDLE_POLL_INTERVAL_TD.total_seconds()
+        + MonoXAPIAdapter.max_request_time
+    )
+    assert longest_gap < KEEP_ALIVE_IDLE_TIMEOUT
+
+
+def test_backoff_releases_connection():
+    """Once polling backs off, the held connection is released."""
+    printer = FakePrinter()
+    bridge = get_bridge(printer)
+    poll(bridge)
+    assert printer.closed == 0
+    poll(bridge)
+    assert printer.closed == 1
+
+
+def test_backoff_while_unreachable():
+    """The interval doubles on each failure after the first, up to the
+    offline maximum."""
+    bridge = get_bridge(FakePrinter())
+    intervals = [poll(bridge) for _ in range(8)]
+    assert intervals == seconds(10, 20, 40, 80, 160, 300, 300, 300)
+    assert max(intervals).total_seconds() == OFFLINE_MAX_POLL_INTERVAL
+
+
+def test_backoff_from_idle_interval():
+    """A printer which drops off while stopped is never polled more often
+    than the idle interval, and backs off beyond it as before."""
+    printer = FakePrinter()
+    bridge = get_bridge(printer)
+    printer.status = STOPPED
+    assert poll(bridge) == IDLE_POLL_INTERVAL_TD
+    printer.status = None
+    intervals = [poll(bridge) for _ in range(6)]
+    assert intervals == seconds(60, 60, 60, 80, 160, 300)
+
+
+def test_backoff_resets_on_success():
+    """A successful poll returns to the normal interval, and the next
+    failure starts the backoff over."""
+    printer = FakePrinter()
+    bridge = get_bridge(printer)
+    for _ in range(4):
+        poll(bridge)
+    printer.status = PRINTING
+    assert poll(bridge) == POLL_INTERVAL_TD
+    printer.status = None
+    assert [poll(bridge) for _ in range(2)] == seconds(10, 20)
+
+
+def test_idle_interval_while_stopped():
+    """A stopped printer is polled at the idle interval, and a printing one
+    at the normal interval. Failures while stopped never poll faster than
+    the idle interval."""
+    printer = FakePrinter()
+    bridge = get_bridge(printer)
+    printer.status = STOPPED
+    assert poll(bridge) == IDLE_POLL_INTERVAL_TD
+    assert IDLE_POLL_INTERVAL_TD == timedelta(seconds=60)
+    printer.status = None
+    for _ in range(3):
+        assert poll(bridge) >= IDLE_POLL_INTERVAL_TD
+    printer.status = PRINTING
+    assert poll(bridge) == POLL_INTERVAL_TD
+
+
+def test_failed_polls_write_state_once():
+    """While the printer is offline, the last known extras are reported with
+    the time they were received. That does not change between failed polls,
+    so the second failed poll does not write another state."""
+    printer = FakePrinter()
+    printer.status = PRINTING
+    printer.extras = {"Current Layer": 88}
+    bridge = get_bridge(printer)
+    sensor = MonoXSensor(
+        bridge=bridge,
+        hass=MagicMock(),
+        entry=get_entry(),
+        native_update="status",
+        name="status",
+    )
+    sensor.async_write_ha_state = MagicMock()
+    poll(bridge)
+    # pylint: disable-next=protected-access
+    sensor._handle_coordinator_update()
+    assert sensor.async_write_ha_state.call_count == 1
+    printer.status = None
+    poll(bridge)
+    # pylint: disable-next=protected-access
+    sensor._handle_coordinator_update()
+    assert sensor.async_write_ha_state.call_count == 2
+    assert sensor.extra_state_attributes["Current Layer"] == 88
+    last_good = sensor.extra_state_attributes[ATTR_LAST_GOOD]
+    # The next poll fails a while later.
+    bridge._last_good_ts -= POLL_INTERVAL_TD.total_seconds()
+    poll(bridge)
+    # pylint: disable-next=protected-access
+    sensor._handle_coordinator_update()
+    assert sensor.async_write_ha_state.call_count == 2
+    assert sensor.extra_state_attributes[ATTR_LAST_GOOD] == last_good
@@ -1,39 +1,30 @@
 """The tests for Octoptint binary sensor module."""
 
-import threading
 import unittest
-import time
 from typing import Iterable
 from uart_wifi.communication import UartWifi
-from uart_wifi.simulate_printer import AnycubicSimulator
+from fake_printer import BoundSimulator
 from uart_wifi.response import MonoXResponseType, MonoXStatus
 
 
 class TestComms(unittest.TestCase):
     """Tests"""
 
-    # This will be set to zero by default in fake_printer. We test this
-    # value until it changes to something other than zero during setup_class
-    # . This gives us a randomized port number to use for the test.
+    # This is replaced during setup_class by the port the fake printer was
+    # bound to. This gives us a randomized port number to use for the test.
     port = 0
 
     @classmethod
     def setup_class(cls):
         """Called when setting up the class to start the fake printer"""
-        # start a fake printer on a new thread.
-        fake_printer = AnycubicSimulator("127.0.0.1", 0)
-        thread = threading.Thread(target=fake_printer.start_server)
-        thread.daemon = False
-        thread.start()
-        # Get the testing port number from the fake printer.
-        while TestComms.port == 0:
-            print("Sleeping while fake printer starts")
-            time.sleep(0.2)
-            TestComms.port = fake_printer.port
-            print("Port is: " + str(TestComms.port))
-        # Give it plenty of time to ensure it is listening.
-        time.sleep(1)
+        # The fake printer binds to a free port on this thread, so the port
+        # is known before its accept loop is started on a new thread.
+        fake_printer = BoundSimulator("127.0.0.1")
         TestComms.port = fake_printer.port
+        print("Port is: " + str(TestComms.port))
+        # The fake printer is already listening, so a request made before
+        # the accept loop runs waits in the backlog rather than being refused.
+        fake_printer.start()
         print("Fake printer started")
 
     def test_connection(self):
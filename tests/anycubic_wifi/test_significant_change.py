@@ -0,0 +1,32 @@
+"""The tests for the significant change support of the integration."""
+
+from unittest.mock import MagicMock
+
+from custom_components.anycubic_wifi.significant_change import (
+    async_check_significant_change,
+)
+
+
+def test_attribute_changes_are_insignificant():
+    """Only the state is significant, so changed attributes alone are not."""
+    assert (
+        async_check_significant_change(
+            MagicMock(),
+            "print",
+            {"Current Layer": 87},
+            "print",
+            {"Current Layer": 88},
+        )
+        is False
+    )
+
+
+def test_state_changes_are_significant():
+    """A changed state is significant, whatever the attributes."""
+    attributes = {"Current Layer": 88}
+    assert (
+        async_check_significant_change(
+            MagicMock(), "print", attributes, "stop", attributes
+        )
+        is True
+    )